@@ -0,0 +1,98 @@
+import threading
+import matplotlib
+matplotlib.use('Agg')
+from matplotlib.artist import setp
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+from matplotlib.dates import HourLocator, DateFormatter
+from functools import lru_cache
+from src.utils.config import load_config, get_timezone
+from src.utils.plot_style import apply_whitegrid_style
+import matplotlib.ticker as ticker
+
+class _CachedDateFormatter(DateFormatter):
+    """DateFormatter that memoizes tick labels by tick value"""
+    def __init__(self, fmt, tz=None, **kwargs):
+        super().__init__(fmt, tz=tz, **kwargs)
+        self._label = lru_cache(maxsize=32)(super().__call__)
+
+    def __call__(self, x, pos=0):
+        # Labels only depend on the tick value, so pos is left out of the key
+        return self._label(x)
+
+    def set_tzinfo(self, tz):
+        super().set_tzinfo(tz)
+        self._label.cache_clear()
+
+class BaseVisualizer:
+    """Shared figure, style and axis formatting for the chart visualizers"""
+    def __init__(self):
+        self.config = load_config()
+        self.visualization_config = self.config['visualization']
+        self.timezone = get_timezone(self.config['data_settings']['timezones']['target'])
+        self.setup_style()
+
+        # The chart layout is fixed, so build the figure once and redraw into it.
+        # The figure is drawn on an Agg canvas directly, bypassing pyplot's
+        # global figure registry
+        self._fig = Figure(figsize=(12, 8), facecolor='white')  # 3:2 ratio
+        FigureCanvasAgg(self._fig)
+        self._ax = self._fig.add_subplot()
+        # Add padding at the top for the titles and bottom for rotated labels;
+        # ax.clear() keeps the axes position, so this is set once
+        self._fig.subplots_adjust(left=0.08, right=0.96, top=0.85, bottom=0.15)
+
+        # Held by subclasses for the whole of each render into the shared figure
+        self._render_lock = threading.Lock()
+
+        # Axis helpers are fixed for the configured timezone
+        self._hour_loc = self._make_hour_locator(self.timezone)
+        self._date_fmt = _CachedDateFormatter('%-I:%M %p', tz=self.timezone)
+        self._y_fmt = ticker.StrMethodFormatter('{x:,.0f}')
+
+    def setup_style(self):
+        """Set up the plotting style"""
+        apply_whitegrid_style()
+        # Adjust figure size to 3:2 aspect ratio while staying under 2000x2000 pixels
+        matplotlib.rcParams['figure.figsize'] = [12, 8]  # 3:2 ratio
+
+    def _make_hour_locator(self, tz):
+        """Build the x-axis hour locator for tz"""
+        return HourLocator(interval=self.visualization_config['hour_interval'], tz=tz)
+
+    def _format_axes(self, ax, tz):
+        """Apply the shared axis labels, ticks, grid and spines"""
+        # Remove labels since units are in subtitle
+        ax.set_xlabel('')
+        ax.set_ylabel('')
+
+        # X-axis time formatting - show more frequent labels
+        if tz is self.timezone:
+            ax.xaxis.set_major_locator(self._hour_loc)
+            ax.xaxis.set_major_formatter(self._date_fmt)
+        else:
+            ax.xaxis.set_major_locator(self._make_hour_locator(tz))
+            ax.xaxis.set_major_formatter(_CachedDateFormatter('%-I:%M %p', tz=tz))
+
+        # Rotate x-axis labels for better readability
+        setp(ax.get_xticklabels(), rotation=45, ha='right')
+
+        # Y-axis formatting with comma separator
+        ax.yaxis.set_major_formatter(self._y_fmt)
+
+        # Lighter grid
+        ax.grid(True, alpha=0.15)
+
+        # Remove top and right spines
+        ax.spines['top'].set_visible(False)
+        ax.spines['right'].set_visible(False)
+
+    def _save(self, output_path):
+        """Save the current figure with optimized settings for Bluesky"""
+        self._fig.savefig(output_path,
+                          dpi=166,  # Optimized DPI to stay under 2000x2000 pixels (12*166=1992)
+                          # Layout is fixed by subplots_adjust, so skip the tight-bbox re-render
+                          facecolor='white',
+                          format='png',  # Explicitly set PNG format
+                          # Fast zlib level; Bluesky re-encodes uploads anyway
+                          pil_kwargs={'compress_level': 1, 'optimize': False})
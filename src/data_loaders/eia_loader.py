@@ -125,12 +125,18 @@ class NuclearDataManager:
         self.nrc_loader = NRCDataLoader()
         self.eia_loader = EIADataLoader()
         self.db = DatabaseManager()
+        self._data_updated = False
 
     def update_data(self):
-        """Update both NRC and EIA data"""
+        """Update both NRC and EIA data, at most once per manager instance"""
+        if self._data_updated:
+            logger.debug("NRC and EIA data already updated, skipping refresh")
+            return
+        
         # Use get_latest_available_data instead of get_reactor_status
         self.nrc_loader.get_latest_available_data()
         self.eia_loader.get_capacity_data()
+        self._data_updated = True
 
     def get_seasonal_capacity(self, month: int, summer_capacity: float, winter_capacity: float) -> float:
         """
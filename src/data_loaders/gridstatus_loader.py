@@ -47,17 +47,18 @@ class GridDataLoader:
         try:
             if start_time >= end_time:
                 logger.info("Database is up to date, no new data to fetch")
-                return self.db.get_data_since(
-                    (end_time - timedelta(days=self.config['days_back'])).isoformat()
-                )
+                return self._get_recent_data(end_time)
             
             # For initial load, fetch in chunks
             if not latest_timestamp:
                 logger.info("Performing chunked historical data fetch...")
                 chunk_size = timedelta(days=5)
                 current_start = start_time
-                all_data = []
 
+                # Write each chunk as it arrives rather than accumulating the
+                # whole history in memory. Each chunk commits on its own, so the
+                # write lock is never held across an API call and a failed
+                # fetch keeps the chunks already stored
                 while current_start < end_time:
                     chunk_end = min(current_start + chunk_size, end_time)
                     logger.info(f"Fetching chunk from {current_start} to {chunk_end}")
@@ -72,16 +73,9 @@ class GridDataLoader:
                     
                     if not chunk_df.empty:
                         chunk_df = self._process_dataframe(chunk_df)
-                        if not chunk_df.empty:
-                            all_data.append(chunk_df)
-                            self.db.upsert_data(chunk_df)
+                        self.db.upsert_data(chunk_df)
                     
                     current_start = chunk_end
-                
-                if all_data:
-                    df = pd.concat(all_data, ignore_index=True)
-                else:
-                    df = pd.DataFrame()
             else:
                 # Regular incremental fetch
                 df = self.client.get_dataset(
@@ -98,9 +92,7 @@ class GridDataLoader:
                         self.db.upsert_data(df)
             
             # Get data from database for analysis
-            df = self.db.get_data_since(
-                (end_time - timedelta(days=self.config['days_back'])).isoformat()
-            )
+            df = self._get_recent_data(end_time)
             
             if df.empty:
                 raise ValueError("No load data available for analysis")
@@ -111,6 +103,12 @@ class GridDataLoader:
             logger.error(f"Error fetching data: {str(e)}")
             raise
 
+    def _get_recent_data(self, end_time):
+        """Read the configured days_back analysis window from the database"""
+        return self.db.get_data_since(
+            (end_time - timedelta(days=self.config['days_back'])).isoformat()
+        )
+
     def _process_dataframe(self, df):
         """Process the raw dataframe"""
         if not isinstance(df, pd.DataFrame):
@@ -1,3 +1,4 @@
+import numpy as np
 import pandas as pd
 import requests
 from datetime import datetime, timedelta
@@ -9,6 +10,10 @@ from src.interfaces import NuclearDataLoader, DataFetchError
 
 logger = setup_logger()
 
+# NRC reports are collected on Eastern time; resolve the zones once per process
+_EASTERN = pytz.timezone('America/New_York')
+_UTC = pytz.UTC
+
 class NRCDataLoader(NuclearDataLoader):
     def __init__(self):
         self.config = load_config()['nuclear_data']['nrc']
@@ -22,7 +27,7 @@ class NRCDataLoader(NuclearDataLoader):
             
             # Parse the pipe-delimited data
             lines = response.text.strip().split('\n')
-            data = []
+            dates, units, powers = [], [], []
             # Skip the header row
             for line in lines[1:]:  # Start from index 1 to skip header
                 if '|' in line:  # Skip malformed lines
@@ -36,22 +41,25 @@ class NRCDataLoader(NuclearDataLoader):
                         actual_time = parsed_date + timedelta(hours=9)
                         
                         # Localize to Eastern time
-                        eastern = pytz.timezone('America/New_York')
-                        localized_time = eastern.localize(actual_time)
+                        localized_time = _EASTERN.localize(actual_time)
                         
                         # Convert to UTC for storage
-                        utc_time = localized_time.astimezone(pytz.UTC)
+                        utc_time = localized_time.astimezone(_UTC)
                         
-                        data.append({
-                            'report_date': utc_time,
-                            'unit_name': unit.strip(),
-                            'power_pct': float(power.strip())
-                        })
+                        power_pct = float(power.strip())
+                        dates.append(utc_time)
+                        units.append(unit.strip())
+                        powers.append(power_pct)
                     except ValueError as e:
                         logger.warning(f"Skipping malformed line: {line}. Error: {str(e)}")
                         continue
             
-            df = pd.DataFrame(data)
+            # Build the frame column-wise so pandas doesn't infer dtypes row by row
+            df = pd.DataFrame({
+                'report_date': pd.DatetimeIndex(dates, tz='UTC'),
+                'unit_name': units,
+                'power_pct': np.asarray(powers, dtype=np.float64)
+            })
             
             # Filter for configured plants only
             if self.config['plants']:
@@ -67,22 +75,21 @@ class NRCDataLoader(NuclearDataLoader):
                     self.db.upsert_nrc_data(df)
                     logger.info(f"Stored new NRC data with timestamp {latest_date}")
                 else:
-                    # Compare with existing data
-                    df_compare = df.merge(
-                        existing_data,
-                        on=['report_date', 'unit_name'],
-                        how='left',
-                        suffixes=('_new', '_existing')
-                    )
+                    # Align the latest report with the stored one by unit and
+                    # compare the power columns element-wise
+                    latest = df[df['report_date'] == latest_date].set_index('unit_name').sort_index()
+                    existing = existing_data.set_index('unit_name').sort_index().reindex(latest.index)
+                    new_power = latest['power_pct'].to_numpy()
+                    existing_power = existing['power_pct'].to_numpy()
                     
-                    # Check if any values are different
-                    changes = df_compare[
-                        abs(df_compare['power_pct_new'] - df_compare['power_pct_existing']) > 0.01
-                    ]
+                    # Units missing from the stored report count as changes
+                    changed_mask = np.isnan(existing_power) | (np.abs(new_power - existing_power) > 0.01)
                     
-                    if not changes.empty:
-                        self.db.upsert_nrc_data(df)
-                        logger.info(f"Updated NRC data with {len(changes)} changes for timestamp {latest_date}")
+                    if changed_mask.any():
+                        # Only write the units that actually changed
+                        delta = latest.reset_index()[changed_mask]
+                        self.db.upsert_nrc_data(delta)
+                        logger.info(f"Updated NRC data with {len(delta)} changes for timestamp {latest_date}")
                     else:
                         logger.info(f"No changes in NRC data for timestamp {latest_date}, skipping upsert")
             else:
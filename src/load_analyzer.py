@@ -1,16 +1,18 @@
 from datetime import datetime, timedelta
 import pytz
 import pandas as pd
+import numpy as np
 from src.utils.logger import setup_logger
-from src.utils.config import load_config
+from src.utils.config import load_config, get_timezone
 
 logger = setup_logger()
 
 class LoadAnalyzer:
     def __init__(self):
-        self.logger = setup_logger()
         self.config = load_config()
-        self.target_tz = pytz.timezone(self.config['data_settings']['timezones']['target'])
+        self.target_tz = get_timezone(self.config['data_settings']['timezones']['target'])
+        # Number of load intervals per hour, from the configured feed cadence
+        self.intervals_per_hour = 60 // self.config['data_settings']['load_interval_minutes']
 
     def calculate_stats(self, df):
         """Calculate comprehensive load statistics for the last 24 hours"""
@@ -22,7 +24,7 @@ class LoadAnalyzer:
             period_start_utc = period_start_local.tz_convert(pytz.UTC)
             
             # Get recent data (last 24 hours)
-            recent_data = df[df['interval_start_utc'] >= period_start_utc].copy()
+            recent_data = df[df['interval_start_utc'] >= period_start_utc]
             
             # Calculate current load
             current_load = recent_data['load.comed'].iloc[-1]
@@ -36,16 +38,17 @@ class LoadAnalyzer:
             load_factor = avg_load / peak_load
             
             # Calculate ramp rates (MW/hr)
-            recent_data['ramp_rate'] = recent_data['load.comed'].diff() * 12  # Convert 5-min rate to hourly
-            max_ramp = recent_data['ramp_rate'].max()
-            max_ramp_idx = recent_data['ramp_rate'].idxmax()
-            max_ramp_time = recent_data.loc[max_ramp_idx, 'interval_start_utc'].tz_convert(self.target_tz)
+            ramp_rate = recent_data['load.comed'].diff().to_numpy() * self.intervals_per_hour  # Convert interval rate to hourly
+            # Locate the peak by position; the leading diff is NaN, so skip NaNs
+            max_ramp_pos = int(np.nanargmax(ramp_rate))
+            max_ramp = ramp_rate[max_ramp_pos]
+            max_ramp_time = recent_data['interval_start_utc'].iloc[max_ramp_pos].tz_convert(self.target_tz)
             
             # Calculate load volatility (standard deviation / mean)
             volatility = recent_data['load.comed'].std() / recent_data['load.comed'].mean()
             
             # Calculate load trend
-            window_size = 12  # 1-hour window (assuming 5-minute intervals)
+            window_size = self.intervals_per_hour  # 1-hour window
             rolling_avg = recent_data['load.comed'].rolling(window=window_size).mean()
             start_avg = rolling_avg.iloc[window_size:window_size*2].mean()
             end_avg = rolling_avg.iloc[-window_size:].mean()
@@ -66,11 +69,11 @@ class LoadAnalyzer:
                 'report_time': now_local
             }
             
-            logger.info(f"Calculated load stats for period {period_start_local} to {now_local}")
+            logger.info("Calculated load stats for period {} to {}", period_start_local, now_local)
             return stats
             
         except Exception as e:
-            logger.error(f"Error calculating stats: {str(e)}")
+            logger.error("Error calculating stats: {}", e)
             raise
 
     def format_stats_message(self, stats):
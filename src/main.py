@@ -1,12 +1,11 @@
 # main.py
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from datetime import datetime
 from dotenv import load_dotenv
 from .data_loader import GridDataLoader, NuclearDataManager
-from .load_visualizer import LoadVisualizer
-from .nuclear_visualizer import NuclearVisualizer
 from .load_analyzer import LoadAnalyzer
 from .nuclear_analyzer import NuclearAnalyzer
 from .bluesky_poster import BlueSkyPoster
@@ -21,15 +20,20 @@ class ComedLoadApp:
         self.processes = self.config['posting']['processes']
         
         # Initialize components based on enabled processes
+        # Visualizers are imported lazily so a disabled process doesn't pay
+        # for loading matplotlib
         if self.processes['load']['enabled']:
+            from .load_visualizer import get_load_visualizer
             self.data_loader = GridDataLoader()
-            self.load_visualizer = LoadVisualizer()
+            self.load_visualizer = get_load_visualizer()
             self.load_analyzer = LoadAnalyzer()
             
         if self.processes['nuclear']['enabled']:
+            from .nuclear_visualizer import get_nuclear_visualizer
             self.nuclear_manager = NuclearDataManager()
-            self.nuclear_visualizer = NuclearVisualizer()
-            self.nuclear_analyzer = NuclearAnalyzer()
+            self.nuclear_visualizer = get_nuclear_visualizer()
+            # Share the manager so the analyzer reuses this cycle's refresh
+            self.nuclear_analyzer = NuclearAnalyzer(self.nuclear_manager)
             
         self.poster = BlueSkyPoster()
         
@@ -48,86 +52,96 @@ class ComedLoadApp:
             path = Path(file_path)
             if path.exists():
                 path.unlink()
-                logger.info(f"Deleted file: {file_path}")
+                logger.info("Deleted file: {}", file_path)
         except Exception as e:
-            logger.error(f"Error deleting file {file_path}: {e}")
+            logger.error("Error deleting file {}: {}", file_path, e)
 
     def run(self):
         """Run the main application logic"""
         try:
             logger.info("Starting ComEd update cycle")
             success = True
+            load_df = None
             
-            # Process load data if enabled
-            if self.processes['load']['enabled']:
-                try:
-                    logger.info("Processing load data")
-                    load_df = self.data_loader.get_load_data()
-                    if load_df.empty:
-                        raise ValueError("No data received from GridStatus API")
+            # GridStatus and NRC/EIA fetches are independent and network-bound,
+            # so start both up front and process the results as they are needed
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                load_future = None
+                nuclear_future = None
+                if self.processes['load']['enabled']:
+                    load_future = executor.submit(self.data_loader.get_load_data)
+                if self.processes['nuclear']['enabled']:
+                    nuclear_future = executor.submit(self.nuclear_manager.update_data)
+                
+                # Process load data if enabled
+                if load_future is not None:
+                    try:
+                        logger.info("Processing load data")
+                        load_df = load_future.result()
+                        if load_df.empty:
+                            raise ValueError("No data received from GridStatus API")
 
-                    # Calculate load stats first since we need them for the chart
-                    load_stats = self.load_analyzer.calculate_stats(load_df)
-                    
-                    # Create and save the load chart
-                    load_chart_path = self.generate_chart_filename('comed_load')
-                    self.load_visualizer.create_load_chart(load_df, output_path=str(load_chart_path))
-                    
-                    # Post the update with stats and chart
-                    if self.poster.post_load_update(load_stats, str(load_chart_path)):
-                        # Delete the image file after successful posting
-                        self.cleanup_file(str(load_chart_path))
-                    logger.info("Load data processing completed")
-                except Exception as e:
-                    logger.error(f"Error processing load data: {str(e)}")
-                    success = False
+                        # Calculate load stats first since we need them for the chart
+                        load_stats = self.load_analyzer.calculate_stats(load_df)
+                        
+                        # Create and save the load chart
+                        load_chart_path = self.generate_chart_filename('comed_load')
+                        self.load_visualizer.create_load_chart(load_df, output_path=str(load_chart_path))
+                        
+                        # Post the update with stats and chart
+                        if self.poster.post_load_update(load_stats, str(load_chart_path)):
+                            # Delete the image file after successful posting
+                            self.cleanup_file(str(load_chart_path))
+                        logger.info("Load data processing completed")
+                    except Exception as e:
+                        logger.error("Error processing load data: {}", e)
+                        success = False
 
-            # Process nuclear data if enabled
-            if self.processes['nuclear']['enabled']:
-                try:
-                    logger.info("Processing nuclear data")
-                    self.nuclear_manager.update_data()
-                    nuclear_stats = self.nuclear_analyzer.calculate_stats(load_df if 'load_df' in locals() else None)
-                    
-                    nuclear_chart_path = self.generate_chart_filename('nuclear')
-                    self.nuclear_visualizer.create_nuclear_chart(
-                        nuclear_stats['nuclear_data'],
-                        nuclear_stats,
-                        output_path=str(nuclear_chart_path)
-                    )
-                    
-                    if self.poster.post_nuclear_update(nuclear_stats, str(nuclear_chart_path)):
-                        # Delete the image file after successful posting
-                        self.cleanup_file(str(nuclear_chart_path))
-                    logger.info("Nuclear data processing completed")
-                except Exception as e:
-                    logger.error(f"Error processing nuclear data: {str(e)}")
-                    success = False
+                # Process nuclear data if enabled
+                if nuclear_future is not None:
+                    try:
+                        logger.info("Processing nuclear data")
+                        nuclear_future.result()
+                        nuclear_stats = self.nuclear_analyzer.calculate_stats(load_df)
+                        
+                        nuclear_chart_path = self.generate_chart_filename('nuclear')
+                        self.nuclear_visualizer.create_nuclear_chart(
+                            nuclear_stats['nuclear_data'],
+                            nuclear_stats,
+                            output_path=str(nuclear_chart_path)
+                        )
+                        
+                        if self.poster.post_nuclear_update(nuclear_stats, str(nuclear_chart_path)):
+                            # Delete the image file after successful posting
+                            self.cleanup_file(str(nuclear_chart_path))
+                        logger.info("Nuclear data processing completed")
+                    except Exception as e:
+                        logger.error("Error processing nuclear data: {}", e)
+                        success = False
 
             logger.info("Update cycle completed")
             return success
 
         except Exception as e:
-            logger.error(f"Error in main execution: {str(e)}")
             self.handle_error(e)
             return False
 
     def handle_error(self, error):
         """Handle application errors"""
-        error_msg = f"ComEd Load Bot Error: {str(error)}"
-        logger.exception(error_msg)
+        logger.exception("ComEd Load Bot Error: {}", error)
 
 def cleanup_old_files():
     """Clean up old chart files"""
     try:
-        output_dir = Path('output')
-        if output_dir.exists():
-            # Delete all PNG files in the output directory
-            for file in output_dir.glob('*.png'):
-                file.unlink()
+        if os.path.isdir('output'):
+            # Delete all PNG files in the output directory in one scandir pass
+            with os.scandir('output') as entries:
+                for entry in entries:
+                    if entry.name.endswith('.png') and entry.is_file():
+                        os.unlink(entry.path)
             logger.info("Cleaned up all PNG files in output directory")
     except Exception as e:
-        logger.error(f"Error cleaning up old files: {e}")
+        logger.error("Error cleaning up old files: {}", e)
 
 def main():
     # Load environment variables
@@ -145,7 +159,7 @@ def main():
     
     missing_vars = [var for var in required_env_vars if not os.getenv(var)]
     if missing_vars:
-        logger.error(f"Missing required environment variables: {', '.join(missing_vars)}")
+        logger.error("Missing required environment variables: {}", ', '.join(missing_vars))
         sys.exit(1)
 
     # Initialize and run application
@@ -3,17 +3,16 @@ import pytz
 import pandas as pd
 import numpy as np
 from src.utils.logger import setup_logger
-from src.utils.config import load_config
+from src.utils.config import load_config, get_timezone
 from src.data_loader import NuclearDataManager
 
 logger = setup_logger()
 
 class NuclearAnalyzer:
-    def __init__(self):
-        self.logger = setup_logger()
+    def __init__(self, nuclear_manager=None):
         self.config = load_config()
-        self.target_tz = pytz.timezone(self.config['data_settings']['timezones']['target'])
-        self.nuclear_manager = NuclearDataManager()
+        self.target_tz = get_timezone(self.config['data_settings']['timezones']['target'])
+        self.nuclear_manager = nuclear_manager or NuclearDataManager()
 
     def check_nrc_data_age(self):
         """Check if NRC data is recent enough based on config settings"""
@@ -36,14 +35,14 @@ class NuclearAnalyzer:
             # Check if data is older than 24 hours
             age = current_time - latest_nrc_time
             if age > timedelta(hours=24):
-                logger.warning(f"NRC data is too old ({age.total_seconds()/3600:.1f} hours)")
+                logger.warning("NRC data is too old ({:.1f} hours)", age.total_seconds() / 3600)
                 return False
                 
-            logger.info(f"NRC data age check passed ({age.total_seconds()/3600:.1f} hours)")
+            logger.info("NRC data age check passed ({:.1f} hours)", age.total_seconds() / 3600)
             return True
             
         except Exception as e:
-            logger.error(f"Error checking NRC data age: {str(e)}")
+            logger.error("Error checking NRC data age: {}", e)
             return False
 
     def calculate_stats(self, load_df, hours=24):
@@ -69,43 +68,39 @@ class NuclearAnalyzer:
             if nuclear_gen.empty:
                 raise ValueError("No nuclear generation data available")
             
-            # Calculate the most common time difference between load data points
-            recent_load = recent_load.sort_values('interval_start_utc')
-            time_diffs = recent_load['interval_start_utc'].diff().dropna()
-            if time_diffs.empty:
-                raise ValueError("Cannot determine time frequency from load data")
-            
-            # Get the most common time difference (mode)
-            freq_td = time_diffs.mode().iloc[0]
-            # Convert timedelta to minutes for creating date_range
-            freq_minutes = int(freq_td.total_seconds() / 60)
-            
-            # Create time range with calculated frequency
-            time_index = pd.date_range(
-                start=period_start_utc,
-                end=now_utc,
-                freq=f'{freq_minutes}min'
-            )
+            # First ensure timestamps are UTC (localizes naive, converts aware)
+            timestamps = pd.to_datetime(nuclear_gen['timestamp'], utc=True)
             
-            # First ensure timestamps are UTC
-            nuclear_gen['timestamp'] = pd.to_datetime(nuclear_gen['timestamp'])
-            if nuclear_gen['timestamp'].dt.tz is None:
-                nuclear_gen['timestamp'] = nuclear_gen['timestamp'].dt.tz_localize('UTC')
-            elif str(nuclear_gen['timestamp'].dt.tz) != 'UTC':
-                nuclear_gen['timestamp'] = nuclear_gen['timestamp'].dt.tz_convert('UTC')
+            # Sum estimated_mw per timestamp, keyed on int64 ns since the epoch
+            # rather than the slower tz-aware values (groupby returns it sorted)
+            unit_mw = pd.Series(nuclear_gen['estimated_mw'].to_numpy())
+            totals = unit_mw.groupby(timestamps.values.view('i8')).sum()
+            nuclear_grouped = pd.DataFrame({
+                'timestamp': pd.to_datetime(totals.index, utc=True),
+                'estimated_mw': totals.to_numpy()
+            })
             
-            # Group by timestamp and sum estimated_mw
-            nuclear_grouped = nuclear_gen.groupby('timestamp')['estimated_mw'].sum().reset_index()
+            # Carry the latest nuclear estimate forward onto each load timestamp
+            recent_load = recent_load.sort_values('interval_start_utc')
+            merged = pd.merge_asof(
+                recent_load,
+                nuclear_grouped,
+                left_on='interval_start_utc',
+                right_on='timestamp',
+                direction='backward'
+            )
             
-            # Set timestamp as index for resampling
-            nuclear_grouped.set_index('timestamp', inplace=True)
+            if merged['estimated_mw'].isna().all():
+                raise ValueError("No overlapping time periods between load and nuclear data")
             
-            # Reindex with forward fill to create continuous time series
-            nuclear_df = nuclear_grouped.reindex(time_index, method='ffill').reset_index()
-            nuclear_df.rename(columns={'index': 'timestamp'}, inplace=True)
+            # Nuclear series aligned to the load timestamps
+            nuclear_df = pd.DataFrame({
+                'timestamp': merged['interval_start_utc'],
+                'estimated_mw': merged['estimated_mw']
+            })
             
             # Calculate total nuclear generation and load
-            total_nuclear = nuclear_df['estimated_mw'].sum()
+            total_nuclear = np.nansum(nuclear_df['estimated_mw'].to_numpy())
             total_load = recent_load['load.comed'].sum()
             
             if total_load == 0:
@@ -114,19 +109,8 @@ class NuclearAnalyzer:
             # Calculate percentage of load that could be supplied by nuclear
             nuclear_percentage = (total_nuclear / total_load) * 100
             
-            # Merge the resampled nuclear data with load data
-            merged = pd.merge(
-                recent_load,
-                nuclear_df,
-                left_on='interval_start_utc',
-                right_on='timestamp',
-                how='inner'
-            )
-            
-            if merged.empty:
-                raise ValueError("No overlapping time periods between load and nuclear data")
-            
-            full_coverage_hours = (merged['estimated_mw'] >= merged['load.comed']).mean() * 100
+            full_coverage_hours = np.mean(
+                merged['estimated_mw'].to_numpy() >= merged['load.comed'].to_numpy()) * 100.0
             
             stats = {
                 'nuclear_percentage': nuclear_percentage,
@@ -135,15 +119,15 @@ class NuclearAnalyzer:
                 'end_time': now_local,
                 'total_nuclear': total_nuclear,
                 'total_load': total_load,
-                'nuclear_data': nuclear_df,  # Use resampled data instead of raw data
+                'nuclear_data': nuclear_df,  # Use load-aligned data instead of raw data
                 'load_data': recent_load      # Include for visualization
             }
             
-            logger.info(f"Calculated nuclear stats for period {period_start_local} to {now_local}")
+            logger.info("Calculated nuclear stats for period {} to {}", period_start_local, now_local)
             return stats
             
         except Exception as e:
-            logger.error(f"Error calculating nuclear stats: {str(e)}")
+            logger.error("Error calculating nuclear stats: {}", e)
             raise
 
     def format_stats_message(self, stats):
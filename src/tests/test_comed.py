@@ -5,7 +5,8 @@ from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import pytz
 import pandas as pd
-from ..load_visualizer import LoadVisualizer
+import numpy as np
+from ..load_visualizer import get_load_visualizer
 from ..load_analyzer import LoadAnalyzer
 from ..utils.logger import setup_logger
 from ..utils.config import load_config
@@ -15,7 +16,7 @@ logger = setup_logger()
 class ComedTestApp:
     def __init__(self):
         self.config = load_config()
-        self.load_visualizer = LoadVisualizer()
+        self.load_visualizer = get_load_visualizer()
         self.load_analyzer = LoadAnalyzer()
         
         # Ensure output directory exists
@@ -45,17 +46,17 @@ class ComedTestApp:
         base_load = 10000  # Base load in MW
         peak_add = 8000    # Additional peak load
         
-        mock_load = []
-        for hour in range(24):
-            if hour < 6:  # Night (midnight to 6am)
-                load = base_load + (hour * 200)
-            elif hour < 12:  # Morning ramp
-                load = base_load + ((hour - 6) * 1000)
-            elif hour < 18:  # Afternoon peak
-                load = base_load + peak_add - ((hour - 12) * 200)
-            else:  # Evening decline
-                load = base_load + peak_add - ((hour - 12) * 800)
-            mock_load.append(max(load, base_load))
+        hour = np.arange(24)
+        load = np.select(
+            [hour < 6, hour < 12, hour < 18],
+            [
+                base_load + (hour * 200),                  # Night (midnight to 6am)
+                base_load + ((hour - 6) * 1000),           # Morning ramp
+                base_load + peak_add - ((hour - 12) * 200)  # Afternoon peak
+            ],
+            default=base_load + peak_add - ((hour - 12) * 800)  # Evening decline
+        )
+        mock_load = np.maximum(load, base_load)
         
         return pd.DataFrame({
             'interval_start_utc': dates,
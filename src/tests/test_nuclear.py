@@ -5,8 +5,9 @@ from dotenv import load_dotenv
 from datetime import datetime, timedelta
 import pytz
 import pandas as pd
+import numpy as np
 from ..data_loader import NuclearDataManager
-from ..nuclear_visualizer import NuclearVisualizer
+from ..nuclear_visualizer import get_nuclear_visualizer
 from ..nuclear_analyzer import NuclearAnalyzer
 from ..utils.logger import setup_logger
 from ..utils.config import load_config
@@ -17,7 +18,7 @@ class NuclearTestApp:
     def __init__(self):
         self.config = load_config()
         self.nuclear_manager = NuclearDataManager()
-        self.nuclear_visualizer = NuclearVisualizer()
+        self.nuclear_visualizer = get_nuclear_visualizer()
         self.nuclear_analyzer = NuclearAnalyzer()
         
         # Ensure output directory exists
@@ -43,10 +44,8 @@ class NuclearTestApp:
         )
         
         # Create mock load values (simulating typical load pattern)
-        mock_load = [
-            15000 + (i * 500 if i < 12 else (24 - i) * 500)  # Simple pattern
-            for i in range(24)
-        ]
+        i = np.arange(24)
+        mock_load = 15000 + np.where(i < 12, i * 500, (24 - i) * 500)  # Simple pattern
         
         return pd.DataFrame({
             'interval_start_utc': dates,
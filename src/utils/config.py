@@ -1,8 +1,24 @@
 import yaml
+import pytz
+from functools import lru_cache
 from pathlib import Path
 
+# Prefer the libyaml-backed loader when PyYAML was built with it
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+@lru_cache(maxsize=1)
 def load_config():
-    """Load configuration from config.yaml"""
+    """Load configuration from config.yaml (parsed once per process)"""
     config_path = Path(__file__).parents[2] / "config.yaml"
     with open(config_path, "r") as f:
-        return yaml.safe_load(f)
+        return yaml.load(f, Loader=_YamlLoader)
+
+@lru_cache(maxsize=None)
+def get_timezone(name):
+    """Return the pytz timezone for name, resolved once per process"""
+    # Kept on pytz deliberately: zoneinfo measured no faster on the chart tick
+    # and tz_convert paths, and the analyzers mix these with pytz.UTC
+    return pytz.timezone(name)
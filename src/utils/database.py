@@ -1,10 +1,38 @@
+import json
 import sqlite3
 import pandas as pd
+from contextlib import contextmanager
 from datetime import datetime
+from pathlib import Path
 from src.utils.logger import setup_logger
 
 logger = setup_logger()
 
+# Per-connection tuning applied on every connect. journal_mode=WAL is
+# persistent in the database file, so it is only set in _ensure_db_exists.
+_CONNECTION_PRAGMAS = (
+    "PRAGMA synchronous=NORMAL",   # Crash-safe under WAL, no fsync per commit
+    "PRAGMA busy_timeout=5000",    # Wait up to 5 s for a concurrent writer
+    "PRAGMA cache_size=-20000",    # ~20 MB page cache
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # Serve reads from a 256 MB memory map
+)
+
+# Schema version recorded in PRAGMA user_version once all migrations are applied
+SCHEMA_VERSION = 1
+
+# Rows per executemany call when upserting grid data
+UPSERT_CHUNK_SIZE = 5000
+
+def _iso_utc(times):
+    """Format timestamps as UTC ISO strings, matching Timestamp.isoformat()"""
+    return pd.to_datetime(times, utc=True).dt.strftime('%Y-%m-%dT%H:%M:%S+00:00').tolist()
+
+def _epoch_seconds(times):
+    """Convert timestamps to integer Unix seconds (UTC)"""
+    utc = pd.to_datetime(times, utc=True).dt.tz_convert(None).to_numpy()
+    return utc.astype('datetime64[s]').astype('int64').tolist()
+
 class DatabaseManager:
     def __init__(self, db_path="data/grid_data.db"):
         self.db_path = db_path
@@ -14,17 +42,24 @@ class DatabaseManager:
         """Create the database and tables if they don't exist"""
         conn = self._get_connection()
         try:
+            conn.execute("PRAGMA journal_mode=WAL")
             cursor = conn.cursor()
             
             # Grid data table
             cursor.execute("""
                 CREATE TABLE IF NOT EXISTS grid_data (
-                    interval_start_utc TIMESTAMP PRIMARY KEY,
-                    interval_end_utc TIMESTAMP,
+                    interval_start_utc INTEGER PRIMARY KEY,
+                    interval_end_utc INTEGER,
                     load_mw REAL,
                     created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
                 )
             """)
+            # MAX(interval_end_utc) is read every cycle by get_latest_timestamp
+            cursor.execute("""
+                CREATE INDEX IF NOT EXISTS idx_interval_end
+                ON grid_data(interval_end_utc)
+            """)
+            self._run_migrations(conn)
             
             # NRC power reactor status table
             cursor.execute("""
@@ -51,6 +86,10 @@ class DatabaseManager:
             """)
             
             conn.commit()
+            
+            # Let SQLite re-analyze any tables whose statistics have drifted;
+            # usually a no-op, and cheap when it isn't
+            conn.execute("PRAGMA optimize")
             logger.info("Database initialized successfully")
         except Exception as e:
             logger.error(f"Error initializing database: {str(e)}")
@@ -58,24 +97,108 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    def _run_migrations(self, conn):
+        """Apply pending schema migrations, tracked in PRAGMA user_version"""
+        if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+            return
+        
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Re-read under the write lock in case another process just migrated
+            current = conn.execute("PRAGMA user_version").fetchone()[0]
+            for version, migrate in ((1, self._migrate_to_v1),):
+                if version > current:
+                    migrate(conn)
+            conn.execute(f"PRAGMA user_version = {SCHEMA_VERSION}")
+            # Refresh planner statistics so the first queries after a migration
+            # see the rebuilt tables
+            conn.execute("ANALYZE")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+
+    def _migrate_to_v1(self, conn):
+        """Move to epoch-second grid timestamps and user_version tracking"""
+        self._migrate_grid_data_to_epoch(conn)
+        # The schema version now lives in PRAGMA user_version
+        conn.execute("DROP TABLE IF EXISTS schema_version")
+
+    def _migrate_grid_data_to_epoch(self, conn):
+        """Convert a grid_data table with ISO text timestamps to Unix seconds"""
+        columns = {row[1]: row[2] for row in conn.execute("PRAGMA table_info(grid_data)")}
+        if columns.get('interval_start_utc', '').upper() == 'INTEGER':
+            return
+        
+        logger.info("Migrating grid_data timestamps to Unix epoch seconds")
+        conn.execute("""
+            CREATE TABLE grid_data_epoch (
+                interval_start_utc INTEGER PRIMARY KEY,
+                interval_end_utc INTEGER,
+                load_mw REAL,
+                created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+            )
+        """)
+        # strftime('%s') honours the stored +HH:MM offsets; rows that name
+        # the same instant in different text formats keep the newest write.
+        # Rows whose start time doesn't parse can't be keyed and are dropped
+        skipped = conn.execute("""
+            SELECT COUNT(*) FROM grid_data
+            WHERE strftime('%s', interval_start_utc) IS NULL
+        """).fetchone()[0]
+        if skipped:
+            logger.warning("Skipping {} grid_data rows with unparseable timestamps", skipped)
+        conn.execute("""
+            INSERT OR REPLACE INTO grid_data_epoch
+            (interval_start_utc, interval_end_utc, load_mw, created_at)
+            SELECT CAST(strftime('%s', interval_start_utc) AS INTEGER),
+                   CAST(strftime('%s', interval_end_utc) AS INTEGER),
+                   load_mw, created_at
+            FROM grid_data
+            WHERE strftime('%s', interval_start_utc) IS NOT NULL
+            ORDER BY created_at
+        """)
+        conn.execute("DROP TABLE grid_data")
+        conn.execute("ALTER TABLE grid_data_epoch RENAME TO grid_data")
+        # DROP TABLE took the old table's indexes with it
+        conn.execute("""
+            CREATE INDEX IF NOT EXISTS idx_interval_end
+            ON grid_data(interval_end_utc)
+        """)
+
     def _get_connection(self):
         """Get a database connection"""
-        return sqlite3.connect(self.db_path)
+        # Autocommit mode: the sqlite3 module never opens implicit transactions,
+        # writes take the lock explicitly via bulk_transaction()
+        conn = sqlite3.connect(self.db_path, isolation_level=None)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
+
+    def _get_read_connection(self):
+        """Get a read-only database connection"""
+        # Under WAL readers never block the writer, and opening them read-only
+        # guarantees they never take the write lock themselves
+        uri = f"{Path(self.db_path).resolve().as_uri()}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True)
+        for pragma in _CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        return conn
 
     def get_latest_timestamp(self):
         """Get the most recent interval_end_utc from the database"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(interval_end_utc) FROM grid_data")
             result = cursor.fetchone()[0]
-            return result if result else None
+            return pd.Timestamp(result, unit='s', tz='UTC') if result else None
         finally:
             conn.close()
 
     def get_latest_nrc_date(self):
         """Get the most recent report date from NRC data"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(report_date) FROM nrc_reactor_status")
@@ -86,7 +209,7 @@ class DatabaseManager:
 
     def get_latest_eia_period(self):
         """Get the most recent period from EIA data"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             cursor = conn.cursor()
             cursor.execute("SELECT MAX(period) FROM eia_capacity")
@@ -97,7 +220,7 @@ class DatabaseManager:
 
     def get_nrc_data_for_date(self, report_date):
         """Get NRC data for a specific report date"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             query = """
                 SELECT report_date, unit_name, power_pct
@@ -105,14 +228,14 @@ class DatabaseManager:
                 WHERE report_date = ?
             """
             df = pd.read_sql_query(query, conn, params=(report_date.isoformat(),))
-            df['report_date'] = pd.to_datetime(df['report_date'])
+            df['report_date'] = pd.to_datetime(df['report_date'], utc=True, format='ISO8601')
             return df
         finally:
             conn.close()
 
     def get_eia_data_for_period(self, period):
         """Get EIA data for a specific period"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             query = """
                 SELECT period, plant_id, generator_id, net_summer_capacity_mw, net_winter_capacity_mw
@@ -123,41 +246,61 @@ class DatabaseManager:
         finally:
             conn.close()
 
+    @contextmanager
+    def bulk_transaction(self):
+        """Run one write under BEGIN IMMEDIATE.
+        
+        Yields a connection holding the write lock. The transaction is
+        committed on exit and rolled back on error.
+        """
+        conn = self._get_connection()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            yield conn
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            conn.close()
+
     def upsert_data(self, df):
         """Upsert data from a pandas DataFrame into the database"""
         if df.empty:
             logger.info("No new data to upsert")
             return 0
 
-        conn = self._get_connection()
-        try:
-            # Rename the load column if needed
-            if 'load.comed' in df.columns:
-                df = df.rename(columns={'load.comed': 'load_mw'})
+        # Accept either load column name without renaming (and copying) the frame
+        load_col = 'load.comed' if 'load.comed' in df.columns else 'load_mw'
 
-            # Convert DataFrame to list of tuples
-            records = []
-            for _, row in df.iterrows():
-                record = (
-                    row['interval_start_utc'].isoformat(),
-                    row['interval_end_utc'].isoformat(),
-                    float(row['load_mw'] if 'load_mw' in df.columns else row['load.comed'])
-                )
-                records.append(record)
-            
+        # Upsert in primary-key order so B-tree page accesses stay sequential,
+        # and update conflicting rows in place rather than delete + reinsert
+        df = df[['interval_start_utc', 'interval_end_utc', load_col]].sort_values('interval_start_utc')
+        query = """
+            INSERT INTO grid_data 
+            (interval_start_utc, interval_end_utc, load_mw)
+            VALUES (?, ?, ?)
+            ON CONFLICT(interval_start_utc) DO UPDATE SET
+                interval_end_utc = excluded.interval_end_utc,
+                load_mw = excluded.load_mw
+        """
+        
+        # Feed executemany one bounded chunk at a time so a large backfill never
+        # holds a second full copy of the frame as Python tuples
+        rows_affected = 0
+        with self.bulk_transaction() as conn:
             cursor = conn.cursor()
-            cursor.executemany("""
-                INSERT OR REPLACE INTO grid_data 
-                (interval_start_utc, interval_end_utc, load_mw)
-                VALUES (?, ?, ?)
-            """, records)
-            
-            conn.commit()
-            rows_affected = cursor.rowcount
-            logger.info(f"Upserted {rows_affected} records into database")
-            return rows_affected
-        finally:
-            conn.close()
+            for start in range(0, len(df), UPSERT_CHUNK_SIZE):
+                chunk = df.iloc[start:start + UPSERT_CHUNK_SIZE]
+                cursor.executemany(query, zip(
+                    _epoch_seconds(chunk['interval_start_utc']),
+                    _epoch_seconds(chunk['interval_end_utc']),
+                    chunk[load_col].to_numpy(dtype='float64').tolist()
+                ))
+                rows_affected += cursor.rowcount
+        
+        logger.info(f"Upserted {rows_affected} records into database")
+        return rows_affected
 
     def upsert_nrc_data(self, df):
         """Upsert NRC reactor status data"""
@@ -165,26 +308,26 @@ class DatabaseManager:
             logger.info("No new NRC data to upsert")
             return 0
 
-        conn = self._get_connection()
-        try:
-            records = [
-                (row['report_date'].isoformat(), row['unit_name'], float(row['power_pct']))
-                for _, row in df.iterrows()
-            ]
-            
+        records = list(zip(
+            _iso_utc(df['report_date']),
+            df['unit_name'].tolist(),
+            df['power_pct'].to_numpy(dtype='float64').tolist()
+        ))
+        records.sort()
+        
+        with self.bulk_transaction() as conn:
             cursor = conn.cursor()
             cursor.executemany("""
-                INSERT OR REPLACE INTO nrc_reactor_status
+                INSERT INTO nrc_reactor_status
                 (report_date, unit_name, power_pct)
                 VALUES (?, ?, ?)
+                ON CONFLICT(report_date, unit_name) DO UPDATE SET
+                    power_pct = excluded.power_pct
             """, records)
             
-            conn.commit()
             rows_affected = cursor.rowcount
             logger.info(f"Upserted {rows_affected} NRC records into database")
             return rows_affected
-        finally:
-            conn.close()
 
     def upsert_eia_data(self, df):
         """Upsert EIA capacity data"""
@@ -192,36 +335,33 @@ class DatabaseManager:
             logger.info("No new EIA data to upsert")
             return 0
 
-        conn = self._get_connection()
-        try:
-            records = [
-                (
-                    row['period'],
-                    row['plant_id'],
-                    row['generator_id'],
-                    float(row['net_summer_capacity_mw']),
-                    float(row['net_winter_capacity_mw'])
-                )
-                for _, row in df.iterrows()
-            ]
-            
+        columns = ['period', 'plant_id', 'generator_id',
+                   'net_summer_capacity_mw', 'net_winter_capacity_mw']
+        records = list(
+            df[columns]
+            .astype({'net_summer_capacity_mw': 'float64', 'net_winter_capacity_mw': 'float64'})
+            .itertuples(index=False, name=None)
+        )
+        records.sort()
+        
+        with self.bulk_transaction() as conn:
             cursor = conn.cursor()
             cursor.executemany("""
-                INSERT OR REPLACE INTO eia_capacity
+                INSERT INTO eia_capacity
                 (period, plant_id, generator_id, net_summer_capacity_mw, net_winter_capacity_mw)
                 VALUES (?, ?, ?, ?, ?)
+                ON CONFLICT(period, plant_id, generator_id) DO UPDATE SET
+                    net_summer_capacity_mw = excluded.net_summer_capacity_mw,
+                    net_winter_capacity_mw = excluded.net_winter_capacity_mw
             """, records)
             
-            conn.commit()
             rows_affected = cursor.rowcount
             logger.info(f"Upserted {rows_affected} EIA records into database")
             return rows_affected
-        finally:
-            conn.close()
 
     def get_data_since(self, start_time):
         """Retrieve data from the database since a given timestamp"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             query = """
                 SELECT interval_start_utc, interval_end_utc, load_mw
@@ -229,13 +369,14 @@ class DatabaseManager:
                 WHERE interval_start_utc >= ?
                 ORDER BY interval_start_utc
             """
-            df = pd.read_sql_query(query, conn, params=(start_time,))
-            
-            # Parse timestamps and ensure they're UTC
-            for col in ['interval_start_utc', 'interval_end_utc']:
-                df[col] = pd.to_datetime(df[col])
-                if df[col].dt.tz is None:
-                    df[col] = df[col].dt.tz_localize('UTC')
+            # Naive start times are taken as UTC, like the stored intervals
+            start_epoch = int(pd.Timestamp(start_time).timestamp())
+            # Timestamps are stored as Unix seconds and parsed while reading
+            epoch_utc = {'unit': 's', 'utc': True}
+            df = pd.read_sql_query(
+                query, conn, params=(start_epoch,),
+                parse_dates={'interval_start_utc': epoch_utc, 'interval_end_utc': epoch_utc}
+            )
             
             # Rename load_mw back to load.comed for compatibility with rest of app
             df = df.rename(columns={'load_mw': 'load.comed'})
@@ -246,7 +387,7 @@ class DatabaseManager:
 
     def get_latest_nrc_data(self, units=None):
         """Get the latest NRC data for specified units"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             query = """
                 WITH latest_date AS (
@@ -255,23 +396,22 @@ class DatabaseManager:
                 )
                 SELECT * FROM nrc_reactor_status 
                 WHERE report_date = (SELECT max_date FROM latest_date)
+                AND (? IS NULL OR unit_name IN (SELECT value FROM json_each(?)))
             """
             
-            if units:
-                placeholders = ','.join('?' * len(units))
-                query += f" AND unit_name IN ({placeholders})"
-                df = pd.read_sql_query(query, conn, params=units)
-            else:
-                df = pd.read_sql_query(query, conn)
+            # The unit list is bound as one JSON array, so the SQL text (and its
+            # cached prepared statement) is the same for any number of units
+            units_json = json.dumps(list(units)) if units else None
+            df = pd.read_sql_query(query, conn, params=(units_json, units_json))
             
-            df['report_date'] = pd.to_datetime(df['report_date'])
+            df['report_date'] = pd.to_datetime(df['report_date'], utc=True, format='ISO8601')
             return df
         finally:
             conn.close()
 
     def get_latest_eia_data(self, plant_ids=None):
         """Get the latest EIA capacity data for specified plants"""
-        conn = self._get_connection()
+        conn = self._get_read_connection()
         try:
             query = """
                 WITH latest_period AS (
@@ -280,14 +420,11 @@ class DatabaseManager:
                 )
                 SELECT * FROM eia_capacity 
                 WHERE period = (SELECT max_period FROM latest_period)
+                AND (? IS NULL OR plant_id IN (SELECT value FROM json_each(?)))
             """
             
-            if plant_ids:
-                placeholders = ','.join('?' * len(plant_ids))
-                query += f" AND plant_id IN ({placeholders})"
-                df = pd.read_sql_query(query, conn, params=plant_ids)
-            else:
-                df = pd.read_sql_query(query, conn)
+            plant_ids_json = json.dumps(list(plant_ids)) if plant_ids else None
+            df = pd.read_sql_query(query, conn, params=(plant_ids_json, plant_ids_json))
             
             return df
         finally:
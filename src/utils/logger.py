@@ -1,8 +1,10 @@
 from loguru import logger
+from functools import lru_cache
 import sys
 
+@lru_cache(maxsize=None)
 def setup_logger():
-    """Configure logging"""
+    """Configure logging (sinks are installed once per process)"""
     logger.remove()
     logger.add(
         sys.stdout,
@@ -10,6 +12,7 @@ def setup_logger():
     )
     logger.add(
         "logs/comed_bot.log",
+        enqueue=True,  # Write the file sink from a background thread
         rotation="1 day",
         retention="7 days",
         format="{time:YYYY-MM-DD HH:mm:ss} | {level} | {name}:{function}:{line} - {message}"
@@ -0,0 +1,35 @@
+import matplotlib
+
+# rcParams equivalent of seaborn's "whitegrid" axes style
+WHITEGRID_STYLE = {
+    'figure.facecolor': 'white',
+    'axes.facecolor': 'white',
+    'axes.edgecolor': '.8',
+    'axes.labelcolor': '.15',
+    'axes.grid': True,
+    'axes.axisbelow': True,
+    'axes.spines.left': True,
+    'axes.spines.bottom': True,
+    'axes.spines.right': True,
+    'axes.spines.top': True,
+    'grid.color': '.8',
+    'grid.linestyle': '-',
+    'text.color': '.15',
+    'xtick.color': '.15',
+    'ytick.color': '.15',
+    'xtick.direction': 'out',
+    'ytick.direction': 'out',
+    'xtick.top': False,
+    'xtick.bottom': False,
+    'ytick.left': False,
+    'ytick.right': False,
+    'font.family': ['sans-serif'],
+    'font.sans-serif': ['Arial', 'DejaVu Sans', 'Liberation Sans', 'Bitstream Vera Sans', 'sans-serif'],
+    'lines.solid_capstyle': 'round',
+    'patch.edgecolor': 'w',
+    'patch.force_edgecolor': True,
+}
+
+def apply_whitegrid_style():
+    """Apply the whitegrid chart style without importing seaborn"""
+    matplotlib.rcParams.update(WHITEGRID_STYLE)
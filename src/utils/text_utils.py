@@ -1,9 +1,9 @@
 from atproto import client_utils
 
+PJM_DATA_URL = "https://www.pjm.com/markets-and-operations"
+
 def create_load_post_text(stats, include_link=True):
     """Create formatted text for load post"""
-    text_builder = client_utils.TextBuilder()
-    
     # Build the main message
     post_text = (
         f"ComEd Load Report "
@@ -14,10 +14,9 @@ def create_load_post_text(stats, include_link=True):
         f"Minimum Load: {stats['minimum']:,.0f} MW"
     )
     
-    text_builder.text(post_text)
+    text_builder = client_utils.TextBuilder().text(post_text)
     
     if include_link:
-        link = "https://www.pjm.com/markets-and-operations"
-        text_builder.text("\n\nData source: ").link("PJM", link)
+        text_builder.text("\n\nData source: ").link("PJM", PJM_DATA_URL)
     
     return text_builder